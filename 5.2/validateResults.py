@@ -28,14 +28,19 @@ from __future__ import annotations
 
 import argparse
 import csv
+import mmap
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence
 
-TOTAL_PATTERN = re.compile(
-    r"^\s*GRAND\s+TOTAL:\s*\$?([0-9_,]+(?:\.[0-9]{1,2})?)\s*$",
-    re.IGNORECASE,
+# Matched against the raw report bytes, so only ASCII spaces and tabs count
+# as blanks around the words and "\r\n" line endings are accepted.
+_TOTAL_PATTERN_B = re.compile(
+    rb"^[ \t]*GRAND[ \t]+TOTAL:[ \t]*\$?([0-9_,]+(?:\.[0-9]{1,2})?)"
+    rb"[ \t\r]*$",
+    re.IGNORECASE | re.MULTILINE,
 )
 
 
@@ -114,16 +119,20 @@ def extract_total(report_path: Path) -> Optional[float]:
     Optional[float]
         The parsed grand total, or None if not found/parsable.
     """
-    text = report_path.read_text(encoding="utf-8", errors="ignore")
-    for line in text.splitlines():
-        match = TOTAL_PATTERN.match(line)
-        if match:
-            raw = match.group(1).replace(",", "").replace("_", "")
-            try:
-                return float(raw)
-            except ValueError:
-                return None
-    return None
+    with open(report_path, "rb") as fh:
+        if fh.seek(0, os.SEEK_END) == 0:
+            return None  # mmap cannot map an empty file
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _TOTAL_PATTERN_B.search(mm)
+            # Copy the group out while the mapping is still open.
+            number = match.group(1) if match else None
+    if number is None:
+        return None
+    raw = number.translate(None, b",_").decode("ascii")
+    try:
+        return float(raw)
+    except ValueError:
+        return None
 
 
 def validate_cases(
@@ -1,7 +1,8 @@
 """CLI application for the Reservation System.
 
 - Presents a Spanish menu to manage Hotels, Customers, and Reservations.
-- Uses the project's service layer (`reservation.service.ReservationService`)
+- Uses the project's service layer (`reservation.hotel_service`,
+  `reservation.customer_service`, `reservation.reservation_service`)
   and JSON storage (`reservation.storage.JsonStore`).
 
 UI strings are Spanish for end-user friendliness; code/docstrings in English
@@ -13,6 +14,12 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 import json as _json
+import sys
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # pylint: disable=invalid-name
 
 from reservation.customer_service import CustomerService
 from reservation.hotel_service import HotelService
@@ -43,6 +50,19 @@ def _input_int(prompt: str, min_value: Optional[int] = None) -> int:
             print("⚠️  Debes capturar un número entero.")
 
 
+def _menu_choice(line: str, count: int) -> Optional[int]:
+    """Return the menu number typed on `line`, or None if it is invalid.
+
+    Only plain ASCII digits without leading zeros name an option, so input
+    such as "01", "+1", "1_3" or non-ASCII digits is rejected.
+    """
+    text = line.strip()
+    if not (text.isascii() and text.isdigit()) or text != str(int(text)):
+        return None
+    choice = int(text)
+    return choice if choice < count else None
+
+
 def bootstrap_data(base: Path) -> None:
     """Create initial JSON files with sample data if they don't exist.
 
@@ -56,15 +76,14 @@ def bootstrap_data(base: Path) -> None:
     reservations_path = base / 'reservations.json'
 
     if not hotels_path.exists():
-        hotels_path.write_text(
+        hotels_path.write_bytes(
             json_dumps_pretty([
                 {"id": "H100", "name": "Hotel Centro", "rooms": 5},
                 {"id": "H200", "name": "Hotel Norte", "rooms": 3},
-            ]),
-            encoding='utf-8',
+            ])
         )
     if not customers_path.exists():
-        customers_path.write_text(
+        customers_path.write_bytes(
             json_dumps_pretty([
                 {
                     "id": "C100",
@@ -76,11 +95,10 @@ def bootstrap_data(base: Path) -> None:
                     "name": "Bob Roe",
                     "email": "bob@example.com"
                 },
-            ]),
-            encoding='utf-8',
+            ])
         )
     if not reservations_path.exists():
-        reservations_path.write_text(
+        reservations_path.write_bytes(
             json_dumps_pretty([
                 {
                     "id": "R100",
@@ -88,17 +106,21 @@ def bootstrap_data(base: Path) -> None:
                     "customer_id": "C100",
                     "room_number": 1
                 }
-            ]),
-            encoding='utf-8',
+            ])
         )
 
 
-def json_dumps_pretty(obj) -> str:
-    return _json.dumps(obj, ensure_ascii=False, indent=2)
+def json_dumps_pretty(obj) -> bytes:
+    """Serialize `obj` as indented UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return _json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
 
 
-def list_hotels(svc: HotelService) -> None:
-    hotels = svc.load_hotels()
+def list_hotels(svc: ReservationService) -> None:
+    hotels = svc.snapshot()['hotels']
     if not hotels:
         print("(No hay hoteles)")
         return
@@ -109,7 +131,7 @@ def list_hotels(svc: HotelService) -> None:
 
 
 def list_customers(svc: ReservationService) -> None:
-    customers = svc.load_customers()
+    customers = svc.snapshot()['customers']
     if not customers:
         print("(No hay clientes)")
         return
@@ -120,7 +142,7 @@ def list_customers(svc: ReservationService) -> None:
 
 
 def list_reservations(svc: ReservationService) -> None:
-    rows = svc._load_reservations()  # pylint: disable=protected-access
+    rows = svc.snapshot()['reservations']
     if not rows:
         print("(No hay reservaciones)")
         return
@@ -145,55 +167,70 @@ def menu_loop() -> None:
     # Seed initial JSON if missing
     bootstrap_data(data_dir)
 
-    store = JsonStore(data_dir)
-    reservation_service = ReservationService(store)
+    # The data files are meant to be read by people, so keep them indented
+    store = JsonStore(data_dir, pretty=True)
     hotel_service = HotelService(store)
     customer_service = CustomerService(store)
-
-    actions = {
-        '1': ('Crear hotel', lambda: action_create_hotel(hotel_service)),
-        '2': ('Mostrar hotel', lambda: action_display_hotel(hotel_service)),
-        '3': ('Modificar hotel', lambda: action_update_hotel(hotel_service)),
-        '4': ('Eliminar hotel', lambda: action_delete_hotel(hotel_service)),
-        '5': ('Listar hoteles', lambda: action_list_hotels(hotel_service)),
-        '6': ('Crear cliente',
-              lambda: action_create_customer(customer_service)),
-        '7': ('Mostrar cliente',
-              lambda: action_display_customer(customer_service)),
-        '8': ('Modificar cliente',
-              lambda: action_update_customer(customer_service)),
-        '9': ('Eliminar cliente',
-              lambda: action_delete_customer(customer_service)),
-        '10': ('Listar clientes',
-               lambda: action_list_customers(customer_service)),
-        '11': ('Crear reservación',
-               lambda: action_create_reservation(reservation_service)),
-        '12': ('Cancelar reservación',
-               lambda: action_cancel_reservation(reservation_service)),
-        '13': ('Listar reservaciones',
-               lambda: action_list_reservations(reservation_service)),
-        '0': ('Salir', None),
-    }
+    reservation_service = ReservationService(
+        store,
+        hotel_service=hotel_service,
+        customer_service=customer_service,
+    )
+
+    # Index == menu number; slot 0 ('Salir') has no handler.
+    actions = [
+        ('Salir', None),
+        ('Crear hotel', lambda: action_create_hotel(hotel_service)),
+        ('Mostrar hotel', lambda: action_display_hotel(hotel_service)),
+        ('Modificar hotel', lambda: action_update_hotel(hotel_service)),
+        ('Eliminar hotel', lambda: action_delete_hotel(hotel_service)),
+        ('Listar hoteles',
+         lambda: action_list_hotels(reservation_service)),
+        ('Crear cliente',
+         lambda: action_create_customer(customer_service)),
+        ('Mostrar cliente',
+         lambda: action_display_customer(customer_service)),
+        ('Modificar cliente',
+         lambda: action_update_customer(customer_service)),
+        ('Eliminar cliente',
+         lambda: action_delete_customer(customer_service)),
+        ('Listar clientes',
+         lambda: action_list_customers(reservation_service)),
+        ('Crear reservación',
+         lambda: action_create_reservation(reservation_service)),
+        ('Cancelar reservación',
+         lambda: action_cancel_reservation(reservation_service)),
+        ('Listar reservaciones',
+         lambda: action_list_reservations(reservation_service)),
+    ]
+
+    menu_text = (
+        "\n===== Sistema de Reservaciones =====\n"
+        + "\n".join(
+            f"{key}. {actions[key][0]}"
+            for key in [*range(1, len(actions)), 0]
+        )
+        + "\nSelecciona una opción: "
+    )
 
     while True:
-        print("\n===== Sistema de Reservaciones =====")
-        for key in [
-            '1', '2', '3', '4', '5', '6',
-            '7', '8', '9', '10', '11', '12', '13',
-            '0'
-        ]:
-            title = actions[key][0]
-            print(f"{key}. {title}")
-        choice = input("Selecciona una opción: ").strip()
-        if choice == '0':
-            print("¡Hasta luego!")
+        sys.stdout.write(menu_text)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            # EOF (e.g. scripted input exhausted): behave like 'Salir'
+            print("\n¡Hasta luego!")
             break
-        action = actions.get(choice)
-        if not action:
+        choice = _menu_choice(line, len(actions))
+        if choice is None:
             print("⚠️  Opción inválida.")
             continue
+        handler = actions[choice][1]
+        if handler is None:
+            print("¡Hasta luego!")
+            break
         try:
-            action[1]()
+            handler()
         except ValueError as exc:
             print(f"❌ Error: {exc}")
         except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -250,7 +287,7 @@ def action_delete_hotel(svc: ReservationService) -> None:
     print("✅ Hotel eliminado.")
 
 
-def action_list_hotels(svc: HotelService) -> None:
+def action_list_hotels(svc: ReservationService) -> None:
     list_hotels(svc)
 
 
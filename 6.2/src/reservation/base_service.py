@@ -0,0 +1,154 @@
+"""Shared plumbing for services backed by one JSON collection.
+
+This module defines `BaseService`, which keeps the parsed models of one
+collection file cached as an ordered `id -> model` mapping and handles
+persisting it: immediate writes, single-row appends, and batched writes.
+`HotelService`, `CustomerService` and `ReservationService` build their
+business operations on top of it.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import (
+    Dict, Generic, Iterator, List, Optional, Protocol, Tuple, Type, TypeVar,
+)
+
+from .storage import JsonStore
+
+
+class Model(Protocol):
+    """What `BaseService` needs from a model class."""
+
+    id: str
+
+    @staticmethod
+    def from_dict(data: Dict) -> Model:
+        """Build a model from a stored row."""
+
+    def to_dict(self) -> Dict:
+        """Return the row to store for this model."""
+
+
+ModelT = TypeVar("ModelT", bound=Model)
+
+
+class BaseService(Generic[ModelT]):
+    """Cached, batchable access to a single JSON collection.
+
+    Subclasses set `FILE` to the collection file name and `MODEL` to the
+    model class (see `Model`).
+    """
+
+    FILE = ""
+    MODEL: Type[Model] = Model
+
+    def __init__(self, store: JsonStore, autoflush: bool = True) -> None:
+        """Initialize the service with a `JsonStore` instance.
+
+        Args:
+            store: JSON store used to persist lists of dictionaries.
+            autoflush: Write every change immediately. When False, changes
+                stay in memory until `flush()` is called.
+        """
+        self.store = store
+        self.autoflush = autoflush
+        self._cache: Optional[Tuple[Optional[Tuple], Dict[str, ModelT]]] = None
+        self._dirty = False
+        self._batch_depth = 0
+
+    def _index(self) -> Dict[str, ModelT]:
+        """Return the cached `id -> model` mapping, in file order.
+
+        The mapping is reused until the file signature changes, so
+        consecutive operations neither re-read the JSON file nor scan a
+        list to find a record. Callers that mutate it must persist it
+        through `_save_index` or `_save_change`. While changes are pending
+        (see `batch`), the in-memory mapping is authoritative.
+        """
+        cached = self._cache
+        if self._dirty and cached is not None:
+            return cached[1]
+        signature = self.store.signature(self.FILE)
+        if cached is None or signature is None or cached[0] != signature:
+            rows: List[Dict] = self.store.load(self.FILE)
+            from_dict = self.MODEL.from_dict
+            by_id = {}
+            for row in rows:
+                model = from_dict(row)
+                by_id[model.id] = model
+            cached = (signature, by_id)
+            self._cache = cached
+        return cached[1]
+
+    def _save_index(self, by_id: Dict[str, ModelT]) -> None:
+        """Make `by_id` the cached mapping and persist it unless batching."""
+        cached = self._cache
+        self._cache = (cached[0] if cached else None, by_id)
+        self._dirty = True
+        if self.autoflush and not self._batch_depth:
+            self.flush()
+
+    def _save_change(self, change: Dict, by_id: Dict[str, ModelT]) -> None:
+        """Persist a single new or changed record.
+
+        When nothing else is pending, only `change` (a full row, or the id
+        plus the fields that changed) is appended to the store (see
+        `JsonStore.append`) instead of rewriting every record; otherwise
+        this defers to `_save_index`.
+        """
+        if self._dirty or not self.autoflush or self._batch_depth:
+            self._save_index(by_id)
+            return
+        try:
+            self.store.append(self.FILE, change)
+        except Exception:
+            self._cache = None
+            raise
+        self._cache = (self.store.signature(self.FILE), by_id)
+
+    @property
+    def pending(self) -> bool:
+        """True while changes are held in memory and not yet written."""
+        return self._dirty
+
+    def flush(self) -> None:
+        """Write pending changes to the store, if any."""
+        if not self._dirty:
+            return
+        by_id = self._cache[1]
+        rows = [m.to_dict() for m in by_id.values()]
+        self._dirty = False
+        try:
+            self.store.save(self.FILE, rows)
+        except Exception:
+            self._cache = None
+            raise
+        self._cache = (self.store.signature(self.FILE), by_id)
+
+    @contextmanager
+    def batch(self) -> Iterator[BaseService[ModelT]]:
+        """Group several mutations into a single write.
+
+        Changes made inside the block are kept in memory and written once
+        when the outermost block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def _can_write_rows(self) -> bool:
+        """Return True when a change can be applied to the raw rows.
+
+        With nothing cached yet and no batch pending, a one-off change is
+        cheaper as a single pass over the stored dicts than building a
+        model for every row only to serialize them again.
+        """
+        return (
+            self._cache is None
+            and self.autoflush
+            and not self._batch_depth
+        )
@@ -10,34 +10,26 @@ It covers all Customer CRUD operations.
 from __future__ import annotations
 from typing import Dict, List, Optional
 
+from .base_service import BaseService
 from .models import Customer
-from .storage import JsonStore
 
 
-class CustomerService:
+class CustomerService(BaseService[Customer]):
     """
     Business operations for Customers
     """
 
     CUSTOMERS = "customers.json"
+    FILE = CUSTOMERS
+    MODEL = Customer
 
     def save_customers(self, customers: List[Customer]) -> None:
         """Stores list of customers"""
-        rows = [c.to_dict() for c in customers]
-        self.store.save(self.CUSTOMERS, rows)
+        self._save_index({c.id: c for c in customers})
 
     def load_customers(self) -> List[Customer]:
         """Return the list of customers from the store."""
-        rows: List[Dict] = self.store.load(self.CUSTOMERS)
-        return [Customer.from_dict(r) for r in rows]
-
-    def __init__(self, store: JsonStore) -> None:
-        """Initialize the service with a `JsonStore` instance.
-
-        Args:
-            store: JSON store used to persist lists of dictionaries.
-        """
-        self.store = store
+        return list(self._index().values())
 
     def create_customer(self, customer_id: str, name: str, email: str) -> None:
         """Create a new customer if `customer_id` is unique and email is valid.
@@ -45,19 +37,21 @@ class CustomerService:
         Args:
             customer_id: Unique customer identifier.
             name: Customer name.
-            email: Email address (must contain '@').
+            email: Email address (must contain '@' after the first char).
 
         Raises:
             ValueError: If data is invalid or the id already exists.
         """
-        if not customer_id or not name or "@" not in email:
+        # One scan; also rejects an '@' with no local part before it
+        if not customer_id or not name or email.find("@") <= 0:
             raise ValueError("Invalid customer data")
-        customers = self.load_customers()
-        if any(c.id == customer_id for c in customers):
+        customers = self._index()
+        if customer_id in customers:
             raise ValueError(f"Customer {customer_id} already exists")
-        customer = Customer(id=customer_id, name=name, email=email)
-        customers.append(customer)
-        self.save_customers(customers)
+        customers[customer_id] = Customer(
+            id=customer_id, name=name, email=email
+        )
+        self._save_index(customers)
 
     def get_customer(self, customer_id: str) -> Optional[Customer]:
         """Return the customer by id, or `None` if it does not exist.
@@ -68,8 +62,7 @@ class CustomerService:
         Returns:
             Customer | None: The customer record if found, else None.
         """
-        customers = self.load_customers()
-        return next((c for c in customers if c.id == customer_id), None)
+        return self._index().get(customer_id)
 
     def delete_customer(self, customer_id: str) -> None:
         """Delete a customer by id.
@@ -80,11 +73,17 @@ class CustomerService:
         Raises:
             ValueError: If the customer does not exist.
         """
-        customers = self.load_customers()
-        new_customers = [c for c in customers if c.id != customer_id]
-        if len(new_customers) == len(customers):
+        if self._can_write_rows():
+            rows: List[Dict] = self.store.load(self.CUSTOMERS)
+            kept = [r for r in rows if r["id"] != customer_id]
+            if len(kept) == len(rows):
+                raise ValueError("Customer not found")
+            self.store.save(self.CUSTOMERS, kept)
+            return
+        customers = self._index()
+        if customers.pop(customer_id, None) is None:
             raise ValueError("Customer not found")
-        self.save_customers(new_customers)
+        self._save_index(customers)
 
     def update_customer(self, customer_id: str, **fields) -> None:
         """Update fields on a customer record (e.g., `name`, `email`).
@@ -96,21 +95,17 @@ class CustomerService:
         Raises:
             ValueError: If the customer does not exist.
         """
-        customers = self.load_customers()
-        idx = next(
-            (i for i, c in enumerate(customers) if c.id == customer_id),
-            -1
-        )
-        if idx < 0:
+        customers = self._index()
+        current = customers.get(customer_id)
+        if current is None:
             raise ValueError("Customer not found")
 
-        current = customers[idx]
         new_name = fields.get("name", current.name)
         new_email = fields.get("email", current.email)
         updated = Customer(id=current.id, name=new_name, email=new_email)
 
-        customers[idx] = updated
-        self.save_customers(customers)
+        customers[customer_id] = updated
+        self._save_index(customers)
 
     def display_customer_info(self, customer_id: str) -> str:
         """Return a human-friendly description of the customer.
@@ -9,31 +9,32 @@ It covers all Hotel CRUD operations.
 from __future__ import annotations
 from typing import Dict, List, Optional
 
+from .base_service import BaseService
 from .models import Hotel
-from .storage import JsonStore
 
 
-class HotelService:
+def _valid_name(value) -> bool:
+    """Return True for a non-empty string."""
+    return isinstance(value, str) and bool(value)
+
+
+def _valid_rooms(value) -> bool:
+    """Return True for a positive integer room count."""
+    return isinstance(value, int) and value > 0
+
+
+class HotelService(BaseService[Hotel]):
     """
     Business operations for Hotels
     """
 
     HOTELS = "hotels.json"
-
-    def __init__(
-            self,
-            store: JsonStore) -> None:
-        """Initialize the service with a `JsonStore` instance.
-
-        Args:
-            store: JSON store used to persist lists of dictionaries.
-        """
-        self.store = store
+    FILE = HOTELS
+    MODEL = Hotel
 
     def load_hotels(self) -> List[Hotel]:
         """Return the list of hotels from the store."""
-        rows: List[Dict] = self.store.load(self.HOTELS)
-        return [Hotel.from_dict(r) for r in rows]
+        return list(self._index().values())
 
     def get_hotel(self, hotel_id: str) -> Optional[Hotel]:
         """Return the hotel by id, or `None` if it does not exist.
@@ -44,18 +45,13 @@ class HotelService:
         Returns:
             dict | None: The hotel record if found, else None.
         """
-        hotels = self.load_hotels()
-        for h in hotels:
-            if h.id == hotel_id:
-                return h
-        return None
+        return self._index().get(hotel_id)
 
     def save_hotels(self, hotels: List[Hotel]) -> None:
         """Stores hotels in storage"""
-        rows = [h.to_dict() for h in hotels]
-        self.store.save(self.HOTELS, rows)
+        self._save_index({h.id: h for h in hotels})
 
-    def create_hotel(self, hotel_id: str, name: str, rooms: int) -> None:
+    def create_hotel(self, hotel_id: str, name: str, rooms: int) -> Hotel:
         """Create a new hotel if `hotel_id` is unique and data is valid.
 
         Args:
@@ -63,17 +59,21 @@ class HotelService:
             name: Hotel name.
             rooms: Total number of rooms (> 0).
 
+        Returns:
+            Hotel: The created hotel, so callers need not look it up again.
+
         Raises:
             ValueError: If data is invalid or the id already exists.
         """
-        if not hotel_id or not name or rooms <= 0:
+        if not hotel_id or not _valid_name(name) or not _valid_rooms(rooms):
             raise ValueError("Invalid hotel data")
-        hotels = self.load_hotels()
-        if any(h.id == hotel_id for h in hotels):
+        hotels = self._index()
+        if hotel_id in hotels:
             raise ValueError(f"Hotel {hotel_id} already exists")
         hotel = Hotel(id=hotel_id, name=name, rooms=rooms)
-        hotels.append(hotel)
-        self.save_hotels(hotels)
+        hotels[hotel_id] = hotel
+        self._save_index(hotels)
+        return hotel
 
     def update_hotel(self, hotel_id: str, **fields) -> None:
         """Update hotel attributes (e.g., name, rooms).
@@ -85,22 +85,21 @@ class HotelService:
         Raises:
             ValueError: If the hotel does not exist or fields are invalid.
         """
-        hotels = self.load_hotels()
-        idx = next((i for i, h in enumerate(hotels) if h.id == hotel_id), -1)
-        if idx < 0:
+        hotels = self._index()
+        current = hotels.get(hotel_id)
+        if current is None:
             raise ValueError("Hotel not found")
 
-        current = hotels[idx]
         new_name = fields.get("name", current.name)
         new_rooms = fields.get("rooms", current.rooms)
 
-        if not isinstance(new_name, str) or not new_name:
+        if not _valid_name(new_name):
             raise ValueError("Invalid hotel name")
-        if not isinstance(new_rooms, int) or new_rooms <= 0:
+        if not _valid_rooms(new_rooms):
             raise ValueError("Invalid rooms value")
 
-        hotels[idx] = Hotel(id=current.id, name=new_name, rooms=new_rooms)
-        self.save_hotels(hotels)
+        hotels[hotel_id] = Hotel(id=current.id, name=new_name, rooms=new_rooms)
+        self._save_index(hotels)
 
     def delete_hotel(self, hotel_id: str) -> None:
         """Delete an hotel by id.
@@ -111,11 +110,17 @@ class HotelService:
         Raises:
             ValueError: If the hotel does not exist.
         """
-        hotels = self.load_hotels()
-        new_hotels = [h for h in hotels if h.id != hotel_id]
-        if len(new_hotels) == len(hotels):
+        if self._can_write_rows():
+            rows: List[Dict] = self.store.load(self.HOTELS)
+            kept = [r for r in rows if r["id"] != hotel_id]
+            if len(kept) == len(rows):
+                raise ValueError("Hotel not found")
+            self.store.save(self.HOTELS, kept)
+            return
+        hotels = self._index()
+        if hotels.pop(hotel_id, None) is None:
             raise ValueError("Hotel not found")
-        self.save_hotels(new_hotels)
+        self._save_index(hotels)
 
     def display_hotel_info(self, hotel_id: str) -> str:
         """Return a human-friendly description of the hotel.
@@ -7,10 +7,33 @@ This module defines the immutable dataclasses used across the application:
 
 These models are intentionally small and "frozen" (immutable) to improve
 predictability in unit tests and to encourage explicit updates through the
-service layer rather than in-place mutations.
+service layer rather than in-place mutations. They declare `__slots__`
+(no per-instance `__dict__`) and serialize with literal dicts, since they
+are built and dumped once per row on every load/save.
 """
 
-from dataclasses import dataclass, asdict, replace
+from dataclasses import dataclass, fields, replace
+import sys
+
+
+def _intern(value):
+    """Intern repeated strings (ids, statuses) so they share one object.
+
+    Reservations repeat a handful of hotel/customer ids and two status
+    values many times; interning deduplicates them and lets `==` succeed
+    on identity.
+    Non-string values are returned unchanged.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _reduce(model):
+    """Rebuild a model from its field values (for `copy` and `pickle`).
+
+    The default protocol restores slots with `setattr`, which frozen
+    dataclasses reject; calling the constructor again avoids that.
+    """
+    return (type(model), tuple(getattr(model, f.name) for f in fields(model)))
 
 
 @dataclass(frozen=True)
@@ -22,6 +45,9 @@ class Hotel:
         name: Human-readable hotel name.
         rooms: Total number of rooms available in this hotel (must be > 0).
     """
+    __slots__ = ("id", "name", "rooms", "_str")
+    __reduce__ = _reduce
+
     id: str
     name: str
     rooms: int
@@ -30,18 +56,27 @@ class Hotel:
     def from_dict(data: dict) -> "Hotel":
         """Create a Hotel instance from a dictionary (store payload)."""
         return Hotel(
-            id=data["id"],
+            id=_intern(data["id"]),
             name=data["name"],
             rooms=data["rooms"],
         )
 
     def to_dict(self) -> dict:
         """Return the dictionary representation (for JSON persistence)."""
-        return asdict(self)
+        return {"id": self.id, "name": self.name, "rooms": self.rooms}
 
     def __str__(self) -> str:
-        """Human-friendly one-liner used to display hotel information."""
-        return f"Hotel {self.id}: {self.name} (rooms={self.rooms})"
+        """Human-friendly one-liner used to display hotel information.
+
+        The instance is immutable, so the text is built once and kept in
+        the private `_str` slot.
+        """
+        try:
+            return self._str
+        except AttributeError:
+            text = f"Hotel {self.id}: {self.name} (rooms={self.rooms})"
+            object.__setattr__(self, "_str", text)
+            return text
 
 
 @dataclass(frozen=True)
@@ -53,6 +88,9 @@ class Customer:
         name: Customer's full name.
         email: Customer's email address.
     """
+    __slots__ = ("id", "name", "email", "_str")
+    __reduce__ = _reduce
+
     id: str
     name: str
     email: str
@@ -61,18 +99,27 @@ class Customer:
     def from_dict(data: dict) -> "Customer":
         """Create a Customer instance from a dictionary (store payload)."""
         return Customer(
-            id=data["id"],
+            id=_intern(data["id"]),
             name=data["name"],
             email=data["email"],
         )
 
     def to_dict(self) -> dict:
         """Return the dictionary representation (for JSON persistence)."""
-        return asdict(self)
+        return {"id": self.id, "name": self.name, "email": self.email}
 
     def __str__(self) -> str:
-        """Human-friendly one-liner used to display customer information."""
-        return f"Customer {self.id}: {self.name} <{self.email}>"
+        """Human-friendly one-liner used to display customer information.
+
+        The instance is immutable, so the text is built once and kept in
+        the private `_str` slot.
+        """
+        try:
+            return self._str
+        except AttributeError:
+            text = f"Customer {self.id}: {self.name} <{self.email}>"
+            object.__setattr__(self, "_str", text)
+            return text
 
 
 @dataclass(frozen=True)
@@ -86,6 +133,11 @@ class Reservation:
         room_number: Room number within the specified hotel.
         status: Current status of the reservation (active, cancelled)
     """
+    __slots__ = (
+        "id", "hotel_id", "customer_id", "room_number", "status", "created_at"
+    )
+    __reduce__ = _reduce
+
     id: str
     hotel_id: str
     customer_id: str
@@ -97,17 +149,24 @@ class Reservation:
     def from_dict(data: dict) -> "Reservation":
         """Create a Reservation instance from a dictionary (store payload)."""
         return Reservation(
-            id=data["id"],
+            id=_intern(data["id"]),
             created_at=data.get("created_at"),
-            hotel_id=data["hotel_id"],
-            customer_id=data["customer_id"],
+            hotel_id=_intern(data["hotel_id"]),
+            customer_id=_intern(data["customer_id"]),
             room_number=data["room_number"],
-            status=data.get("status")
+            status=_intern(data.get("status"))
         )
 
     def to_dict(self) -> dict:
         """Return the dictionary representation (for JSON persistence)."""
-        return asdict(self)
+        return {
+            "id": self.id,
+            "hotel_id": self.hotel_id,
+            "customer_id": self.customer_id,
+            "room_number": self.room_number,
+            "status": self.status,
+            "created_at": self.created_at,
+        }
 
     def cancel(self) -> "Reservation":
         """Returns a new Reservation instance with status='cancelled'"""
@@ -9,16 +9,42 @@ It covers:
 """
 
 from __future__ import annotations
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 
+from .base_service import BaseService
 from .hotel_service import HotelService
 from .customer_service import CustomerService
-from .models import Reservation
+from .models import Customer, Hotel, Reservation
 from .storage import JsonStore
 
+RoomKey = Tuple[str, int]
+ReservationRow = Tuple[str, str, str, int]
 
-class ReservationService:
+
+def _local_now() -> str:
+    """Return the current local time as an ISO 8601 string.
+
+    The UTC offset is looked up on every call, so timestamps stay correct
+    across daylight-saving changes in a long-running process.
+    """
+    return datetime.now().astimezone().isoformat()
+
+
+class _Lookups(NamedTuple):
+    """What a new reservation is validated against (see `_add_reservation`).
+
+    `hotel` and `customer` resolve ids; `reservations` and `rooms` are the
+    cached indexes the new reservation is added to.
+    """
+
+    hotel: Callable[[str], Optional[Hotel]]
+    customer: Callable[[str], Optional[Customer]]
+    reservations: Dict[str, Reservation]
+    rooms: Dict[RoomKey, str]
+
+
+class ReservationService(BaseService[Reservation]):
     """Business operations for Reservations.
 
     This service abstracts file access through `JsonStore` and centralizes
@@ -28,30 +54,112 @@ class ReservationService:
     """
 
     RESERVATIONS = "reservations.json"
+    FILE = RESERVATIONS
+    MODEL = Reservation
 
-    def __init__(
+    # Every option after `now` is keyword-only.
+    def __init__(  # pylint: disable=too-many-arguments
             self,
             store: JsonStore,
-            now: Optional[Callable[[], str]] = None) -> None:
+            now: Optional[Callable[[], str]] = None,
+            *,
+            autoflush: bool = True,
+            hotel_service: Optional[HotelService] = None,
+            customer_service: Optional[CustomerService] = None) -> None:
         """Initialize the service with a `JsonStore` instance.
 
         Args:
             store: JSON store used to persist lists of dictionaries.
+            now: Clock returning the ISO timestamp for new reservations.
+            autoflush: Write every change immediately. When False, changes
+                stay in memory until `flush()` is called.
+            hotel_service: Service used to look up hotels. Pass the one the
+                caller already holds to share its cache; a new one is
+                built on `store` otherwise.
+            customer_service: Same as `hotel_service`, for customers.
         """
-        self.store = store
-        self.now = now or (lambda: datetime.now().astimezone().isoformat())
-        self.hotel_service = HotelService(store)
-        self.customer_service = CustomerService(store)
+        super().__init__(store, autoflush)
+        self.now = now or _local_now
+        if hotel_service is None:
+            hotel_service = HotelService(store)
+        if customer_service is None:
+            customer_service = CustomerService(store)
+        self.hotel_service = hotel_service
+        self.customer_service = customer_service
+        # (reservation index it was built from, active-room index)
+        self._rooms: Optional[
+            Tuple[Dict[str, Reservation], Dict[RoomKey, str]]
+        ] = None
+        # (file signatures, snapshot)
+        self._snapshot: Optional[Tuple[Tuple, Dict[str, List]]] = None
 
     def _load_reservations(self) -> List[Reservation]:
         """Return the list of reservations from the store."""
-        rows: List[Dict] = self.store.load(self.RESERVATIONS)
-        return [Reservation.from_dict(r) for r in rows]
+        return list(self._index().values())
+
+    def _state(self) -> Tuple[Dict[str, Reservation], Dict[RoomKey, str]]:
+        """Return the cached reservation index and active-room index.
+
+        The room index is derived from the `id -> Reservation` mapping
+        and rebuilt only when `_index` hands out a different mapping;
+        callers that change a reservation's room or status update both
+        in place before persisting them.
+        """
+        by_id = self._index()
+        if self._rooms is None or self._rooms[0] is not by_id:
+            self._rooms = (by_id, self._rooms_of(by_id))
+        return self._rooms
+
+    @staticmethod
+    def _rooms_of(by_id: Dict[str, Reservation]) -> Dict[RoomKey, str]:
+        """Build the active-room index for the given reservations."""
+        return {
+            (r.hotel_id, r.room_number): r.id
+            for r in by_id.values()
+            if r.status == "active"
+        }
 
     def _save_reservations(self, reservations: List[Reservation]) -> None:
         """Persist the given list of reservations to the store."""
-        rows = [r.to_dict() for r in reservations]
-        self.store.save(self.RESERVATIONS, rows)
+        self._save_index({r.id: r for r in reservations})
+
+    def load_reservations(self) -> List[Reservation]:
+        """Return the list of reservations from the store."""
+        return self._load_reservations()
+
+    def snapshot(self) -> Dict[str, List]:
+        """Return hotels, customers and reservations for read-only listing.
+
+        The result is cached and only rebuilt when one of the underlying
+        JSON files changes (see `JsonStore.signature`), so repeated listings
+        in an interactive session do not re-read and re-parse the files.
+        While a service has unwritten changes (see `batch`), the files do
+        not reflect them, so the snapshot is rebuilt on every call.
+
+        Returns:
+            dict: Keys 'hotels', 'customers' and 'reservations' mapped to
+            lists of model instances. Treat it as read-only.
+        """
+        services = (self.hotel_service, self.customer_service, self)
+        if any(svc.pending for svc in services):
+            self._snapshot = None
+            return self._build_snapshot()
+        key = (
+            self.store.signature(HotelService.HOTELS),
+            self.store.signature(CustomerService.CUSTOMERS),
+            self.store.signature(self.RESERVATIONS),
+        )
+        if self._snapshot is None or key != self._snapshot[0]:
+            self._snapshot = (key, self._build_snapshot())
+        return self._snapshot[1]
+
+    def _build_snapshot(self) -> Dict[str, List]:
+        """Load the three collections for `snapshot`."""
+        return {
+            "hotels": self.hotel_service.load_hotels(),
+            "customers": self.customer_service.load_customers(),
+            "reservations": self._load_reservations(),
+        }
 
     # -------- Reservations --------
     def create_reservation(
@@ -81,35 +189,94 @@ class ReservationService:
             ValueError: If the hotel/customer is missing, room is invalid,
                         id is duplicated, or the room is already taken.
         """
-        hotel = self.hotel_service.get_hotel(hotel_id)
+        lookups = _Lookups(
+            self.hotel_service.get_hotel,
+            self.customer_service.get_customer,
+            *self._state(),
+        )
+        new_reservation = self._add_reservation(
+            (reservation_id, hotel_id, customer_id, room_number), lookups
+        )
+        self._save_change(new_reservation.to_dict(), lookups.reservations)
+        return reservation_id
+
+    def _add_reservation(
+        self, row: ReservationRow, lookups: _Lookups
+    ) -> Reservation:
+        """Validate a new reservation and add it to the in-memory indexes.
+
+        `row` is `(reservation_id, hotel_id, customer_id, room_number)`.
+        Applies the rules documented on `create_reservation`; persisting
+        the change is left to the caller.
+        """
+        reservation_id, hotel_id, customer_id, room_number = row
+        hotel = lookups.hotel(hotel_id)
+        customer = lookups.customer(customer_id)
+        reservations, rooms = lookups.reservations, lookups.rooms
         if hotel is None:
             raise ValueError("Hotel not found")
-        customer = self.customer_service.get_customer(customer_id)
         if customer is None:
             raise ValueError("Customer not found")
+        room_number = int(room_number)
         if room_number <= 0 or room_number > hotel.rooms:
             raise ValueError("Invalid room number")
-
-        reservations = self._load_reservations()
-        if any(r.id == reservation_id for r in reservations):
+        if reservation_id in reservations:
             raise ValueError("Reservation id already exists")
-        if any(
-            r.hotel_id == hotel_id
-            and r.room_number == int(room_number)
-            and r.status == "active"
-            for r in reservations
-        ):
+        # Reuse the stored (interned) id objects rather than the caller's
+        # strings, so new reservations share them like loaded ones do.
+        room_key = (hotel.id, room_number)
+        if room_key in rooms:
             raise ValueError("Room already taken")
 
         new_reservation = Reservation(id=reservation_id,
                                       created_at=self.now(),
-                                      hotel_id=hotel_id,
-                                      customer_id=customer_id,
+                                      hotel_id=hotel.id,
+                                      customer_id=customer.id,
                                       room_number=room_number,
                                       status="active")
-        reservations.append(new_reservation)
-        self._save_reservations(reservations)
-        return reservation_id
+        reservations[reservation_id] = new_reservation
+        rooms[room_key] = reservation_id
+        return new_reservation
+
+    def create_reservations_bulk(
+        self,
+        rows: Iterable[ReservationRow],
+    ) -> List[str]:
+        """Create many reservations with a single write.
+
+        Each row is validated exactly like `create_reservation`, including
+        against the rows before it in the same call. Either every row is
+        created or, if one is invalid, none is.
+
+        Args:
+            rows: `(reservation_id, hotel_id, customer_id, room_number)`
+                tuples.
+
+        Returns:
+            list[str]: The created reservation ids, in input order.
+
+        Raises:
+            ValueError: On the first invalid row (see `create_reservation`).
+        """
+        # Resolve every index once instead of re-checking the files'
+        # signatures for each row.
+        # pylint: disable=protected-access
+        lookups = _Lookups(
+            self.hotel_service._index().get,
+            self.customer_service._index().get,
+            *self._state(),
+        )
+        # pylint: enable=protected-access
+        backup = dict(lookups.reservations)
+        try:
+            created = [self._add_reservation(row, lookups).id for row in rows]
+        except Exception:
+            # The room index is rebuilt from the restored mapping.
+            self._cache = (self._cache[0], backup)
+            raise
+        if created:
+            self._save_index(lookups.reservations)
+        return created
 
     def cancel_reservation(self, reservation_id: str) -> None:
         """Cancel a reservation by id.
@@ -120,15 +287,15 @@ class ReservationService:
         Raises:
             ValueError: If the reservation does not exist.
         """
-        reservations = self._load_reservations()
-        idx = next(
-            (i for i, c in enumerate(reservations) if c.id == reservation_id),
-            -1
-        )
-        if idx < 0:
+        reservations, rooms = self._state()
+        current = reservations.get(reservation_id)
+        if current is None:
             raise ValueError("Reservation not found")
 
-        current = reservations[idx]
-
-        reservations[idx] = current.cancel()
-        self._save_reservations(reservations)
+        reservations[reservation_id] = current.cancel()
+        room_key = (current.hotel_id, current.room_number)
+        if rooms.get(room_key) == reservation_id:
+            del rooms[room_key]
+        self._save_change(
+            {"id": reservation_id, "status": "cancelled"}, reservations
+        )
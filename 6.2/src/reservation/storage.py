@@ -6,13 +6,101 @@ to persist *lists of dictionaries* for simple CRUD-like operations.
 Design goals:
 - Keep I/O concerns isolated from business logic (services).
 - Be resilient to malformed JSON files: when decoding fails, log the error
+  (through `logging`, which prints to stderr unless configured otherwise)
   and continue with an empty list (so the application can keep running).
+- Use `orjson` (C implementation) for encoding/decoding when it is
+  installed; fall back to the standard library otherwise.
+- Let callers add or replace a single row by appending one JSON line to a
+  side log (`<name>.log`) instead of rewriting the whole file; `load`
+  folds the log back in; `save`, or `append` once the log outgrows the
+  file, compacts it away.
+- Coalesce bursts of writes with `buffered()`.
 """
 
 from __future__ import annotations
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import json
+import logging
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # pylint: disable=invalid-name
+
+_log = logging.getLogger(__name__)
+
+# The log is folded into the JSON file by `append` once it outgrows both
+# this floor and twice the size of the file itself.
+_COMPACT_MIN_SIZE = 64 * 1024
+
+# Files at least this large are parsed straight from a read-only memory
+# map instead of being copied into a `bytes` object first.
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _loads(data: bytes):
+    """Decode JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _read_file(path: Path, size: int) -> bytes:
+    """Read a whole file with raw `os.read` calls, sized from `stat`.
+
+    Skips the buffered-IO layer of `Path.read_bytes`. Keeps reading until
+    `os.read` returns no data, since a single call may return fewer bytes
+    than asked for (network filesystems, signals, very large files) and
+    the file may have grown after it was stat'ed.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = []
+        want = size + 1
+        while True:
+            chunk = os.read(fd, want)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+            want = 1 << 16
+    finally:
+        os.close(fd)
+
+
+def _load_mapped(path: Path):
+    """Decode a large JSON file from a read-only memory map."""
+    with open(path, "rb") as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+def _dumps(rows: List[Dict], pretty: bool = False) -> bytes:
+    """Encode rows as UTF-8 JSON (orjson when available).
+
+    Output is compact unless `pretty` asks for two-space indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            rows, option=orjson.OPT_INDENT_2 if pretty else None
+        )
+    if pretty:
+        text = json.dumps(rows, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def _dumps_line(row: Dict) -> bytes:
+    """Encode one row as a compact, newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+    line = json.dumps(row, ensure_ascii=False, separators=(",", ":"))
+    return (line + "\n").encode("utf-8")
 
 
 class JsonStore:
@@ -22,13 +110,21 @@ class JsonStore:
     to a single JSON file that contains a list of dictionary rows.
     """
 
-    def __init__(self, base_path: Path) -> None:
+    def __init__(self, base_path: Path, pretty: bool = False) -> None:
         """Create a store rooted at `base_path`.
 
         Args:
             base_path: Directory where collection JSON files live.
+            pretty: Indent saved files for human reading. Compact output
+                is smaller and faster to encode.
         """
         self.base_path = Path(base_path)
+        self.pretty = pretty
+        self._generation: Dict[str, int] = {}
+        self._buffer: Dict[str, List[Dict]] = {}
+        self._buffer_depth = 0
+        self._parsed: Dict[str, Tuple[Tuple[int, int, int], List[Dict]]] = {}
+        self._paths: Dict[str, Tuple[Path, Path]] = {}
 
     def _file(self, name: str) -> Path:
         """Return the absolute path for the given collection file name.
@@ -39,15 +135,75 @@ class JsonStore:
         Returns:
             Path: Absolute path to the target JSON file within `base_path`.
         """
-        return self.base_path / name
+        return self._paths_of(name)[0]
+
+    def _log_file(self, name: str) -> Path:
+        """Return the path of the append log for the given collection."""
+        return self._paths_of(name)[1]
+
+    def _paths_of(self, name: str) -> Tuple[Path, Path]:
+        """Return the `(file, log)` paths of a collection, built once.
+
+        `signature` stats both on every service operation, so the joined
+        paths are kept instead of being rebuilt on each call.
+        """
+        paths = self._paths.get(name)
+        if paths is None:
+            file_path = self.base_path / name
+            paths = (file_path, file_path.with_suffix(".log"))
+            self._paths[name] = paths
+        return paths
+
+    def _stat(self, name: str) -> Optional[Tuple[int, int, int]]:
+        """Return `(st_mtime_ns, st_size, log size)` or None if missing.
+
+        A collection that only has an append log so far (rows appended
+        before the file was first saved) reports `(-1, 0, log size)`.
+        """
+        file_path, log_path = self._paths_of(name)
+        try:
+            log_size = log_path.stat().st_size
+        except FileNotFoundError:
+            log_size = 0
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            return (-1, 0, log_size) if log_size else None
+        return (st.st_mtime_ns, st.st_size, log_size)
+
+    def signature(self, name: str) -> Optional[Tuple[int, ...]]:
+        """Return a cheap change token for the named JSON file.
+
+        The token combines the number of writes issued through this store
+        with the file's `st_mtime_ns` and `st_size` and the size of its
+        append log, so callers can cache derived data and detect both
+        local and external modifications.
+
+        Args:
+            name: File name (e.g., 'hotels.json').
+
+        Returns:
+            tuple | None: Change token, or None if the file does not exist.
+        """
+        stat = self._stat(name)
+        if stat is None:
+            return None
+        return (self._generation.get(name, 0), *stat)
 
     def load(self, name: str) -> List[Dict]:
         """Load a list of dictionaries from the named JSON file.
 
         Behavior:
         - If the file does not exist, an empty list is returned.
-        - If the file contents are not valid JSON, an error message is printed
-          and an empty list is returned (execution continues).
+        - If the file contents are not valid JSON, an error is logged and an
+          empty list is returned (execution continues).
+        - In both cases rows already appended to the log are still
+          returned, so nothing written with `append` is lost.
+        - Rows appended with `append` are merged into the row with the same
+          `id`, or added at the end when the id is new.
+        - The parsed list is kept until the file or its log changes on disk
+          and returned again by later calls, so callers must treat it (and
+          its rows) as read-only.
 
         Args:
             name: File name to load (e.g., 'customers.json').
@@ -56,16 +212,96 @@ class JsonStore:
             list[dict]: Parsed list from the JSON file, or [] if
             missing/invalid.
         """
-        file_path = self._file(name)
-        if not file_path.exists():
+        if name in self._buffer:
+            return self._buffer[name]
+        stat = self._stat(name)
+        if stat is None:
             return []
+        cached = self._parsed.get(name)
+        if cached is not None and cached[0] == stat:
+            return cached[1]
+        file_path = self._file(name)
+        size = stat[1]
         try:
-            return json.loads(file_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
+            if stat[0] < 0:
+                rows = []
+            elif orjson is not None and size >= _MMAP_MIN_SIZE:
+                rows = _load_mapped(file_path)
+            else:
+                rows = _loads(_read_file(file_path, size))
+        except ValueError as exc:
             # Requirement: handle invalid data gracefully and continue
-            print(f"[ERROR] {name}: invalid JSON ({exc})")
-            print("[WARN] Continuing with empty list")
-            return []
+            _log.error(
+                "%s: invalid JSON (%s); continuing with empty list",
+                name, exc,
+            )
+            rows = []
+        if stat[2]:
+            log_data = _read_file(self._log_file(name), stat[2])
+            rows = self._replay(name, rows, log_data)
+        self._parsed[name] = (stat, rows)
+        return rows
+
+    @staticmethod
+    def _replay(name: str, rows: List[Dict], log_data: bytes) -> List[Dict]:
+        """Merge the rows of an append log, in order, into `rows` by id."""
+        entries = []
+        for line in log_data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entries.append(_loads(line))
+            except ValueError:
+                # A torn last line from an interrupted append
+                _log.warning("%s: skipping unreadable log entry", name)
+        return JsonStore._merge(rows, entries)
+
+    @staticmethod
+    def _merge(rows: List[Dict], entries: Iterable[Dict]) -> List[Dict]:
+        """Merge `entries`, in order, into `rows` by id (see `append`)."""
+        by_id = {row["id"]: row for row in rows}
+        for row in entries:
+            key = row["id"]
+            current = by_id.get(key)
+            by_id[key] = row if current is None else {**current, **row}
+        return list(by_id.values())
+
+    def append(self, name: str, row: Dict) -> None:
+        """Add a row, or update fields of one, without rewriting the file.
+
+        The row is written as a single line to the collection's append
+        log; `load` applies it on top of the file contents. A row whose
+        `id` already exists only needs the fields that change. Once the
+        log grows well past the file, it is folded back into the file.
+
+        Args:
+            name: File name of the collection (e.g., 'reservations.json').
+            row: Dictionary record (or partial record) with an `id` key.
+        """
+        if self._buffer_depth:
+            self._buffer[name] = self._merge(self.load(name), [row])
+        elif name in self._buffer:
+            # Left over from a failed `buffered` flush: the file is behind,
+            # so write the whole collection instead of a log line.
+            self._write(name, self._merge(self._buffer[name], [row]))
+            del self._buffer[name]
+        else:
+            self._parsed.pop(name, None)
+            line = _dumps_line(row)
+            with open(self._log_file(name), "a+b") as fh:
+                end = fh.seek(0, os.SEEK_END)
+                if end:
+                    fh.seek(end - 1)
+                    if fh.read(1) != b"\n":
+                        # End a torn line left by an interrupted append, so
+                        # only that line is lost and not this one too.
+                        line = b"\n" + line
+                fh.write(line)
+                log_size = fh.tell()
+            stat = self._stat(name)
+            if log_size > max(2 * stat[1], _COMPACT_MIN_SIZE):
+                self._write(name, self.load(name))
+        self._generation[name] = self._generation.get(name, 0) + 1
 
     def save(self, name: str, rows: List[Dict]) -> None:
         """Persist the given list of dictionaries into the named JSON file.
@@ -74,7 +310,64 @@ class JsonStore:
             name: File name to write (e.g., 'reservations.json').
             rows: List of dictionary records to serialize.
         """
-        self._file(name).write_text(
-            json.dumps(rows, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        if self._buffer_depth:
+            self._buffer[name] = list(rows)
+        else:
+            self._write(name, rows)
+            self._buffer.pop(name, None)
+        self._generation[name] = self._generation.get(name, 0) + 1
+
+    def _write(self, name: str, rows: List[Dict]) -> None:
+        """Write `rows` as the whole collection file and drop its log."""
+        self._parsed.pop(name, None)
+        target = self._file(name)
+        tmp = target.with_name(target.name + ".tmp")
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(_dumps(rows, self.pretty))
+                fh.flush()
+                os.fsync(fh.fileno())
+            # Readers (and a crash) see either the old or the new file,
+            # never a partially written one.
+            os.replace(tmp, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        # The file now holds every appended row; drop the log.
+        self._log_file(name).unlink(missing_ok=True)
+        # What was just written is what the next load would parse.
+        self._parsed[name] = (self._stat(name), list(rows))
+
+    @contextmanager
+    def buffered(self) -> Iterator[JsonStore]:
+        """Hold writes in memory and write each file once on exit.
+
+        Inside the block `save` and `append` only update an in-memory copy
+        that `load` returns, so any number of changes to a collection,
+        from any service sharing this store, costs a single write when the
+        outermost block exits.
+
+        If the block raises, the buffered changes are discarded and
+        nothing is written. If writing a file fails on exit, the error
+        propagates and that file and any not yet written stay buffered
+        (`load` still returns them); they are written by the next `save`
+        or `append` of the collection, or when a later block exits.
+        """
+        self._buffer_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._buffer_depth -= 1
+            if not self._buffer_depth:
+                for name in self._buffer:
+                    self._generation[name] = (
+                        self._generation.get(name, 0) + 1
+                    )
+                self._buffer.clear()
+            raise
+        self._buffer_depth -= 1
+        if not self._buffer_depth:
+            for name in list(self._buffer):
+                self._write(name, self._buffer[name])
+                del self._buffer[name]
+                self._generation[name] = self._generation.get(name, 0) + 1
@@ -0,0 +1,34 @@
+"""CLI tests for parsing the menu option typed by the user."""
+
+# Keep tests lightweight—method names tell the story.
+# pylint: disable=missing-function-docstring
+# The parser under test is a private helper of the script.
+# pylint: disable=protected-access
+import importlib.util
+import unittest
+from pathlib import Path
+
+_SPEC = importlib.util.spec_from_file_location(
+    "cli", Path(__file__).resolve().parents[1] / "scripts" / "cli.py"
+)
+cli = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(cli)
+
+OPTIONS = 14
+
+
+class MenuChoiceTest(unittest.TestCase):
+    """Which lines select a menu option."""
+
+    def test_plain_numbers_select_options(self):
+        self.assertEqual(0, cli._menu_choice("0\n", OPTIONS))
+        self.assertEqual(1, cli._menu_choice(" 1 \n", OPTIONS))
+        self.assertEqual(13, cli._menu_choice("13\n", OPTIONS))
+
+    def test_other_spellings_are_invalid(self):
+        for line in ("1_3", "+1", "-1", "01", "١", "1.0", "", "x"):
+            with self.subTest(line=line):
+                self.assertIsNone(cli._menu_choice(line + "\n", OPTIONS))
+
+    def test_out_of_range_is_invalid(self):
+        self.assertIsNone(cli._menu_choice("14\n", OPTIONS))
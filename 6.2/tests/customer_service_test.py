@@ -10,16 +10,30 @@ import unittest
 from unittest.mock import MagicMock
 
 from reservation.customer_service import CustomerService
+from reservation.models import Customer
 
 
-class CustomerTest(unittest.TestCase):
-    """Customer CRUD scenarios using a per-test mock JSON store."""
+class _CustomerTestCase(unittest.TestCase):
+    """Shared fixture: a CustomerService over a per-test mock JSON store."""
 
     def setUp(self):
         # Mocked store for every test
         self.store = MagicMock()
         self.svc = CustomerService(self.store)
 
+    def _assert_save(self, data):
+        self.store.save.assert_called_once()
+        args, _ = self.store.save.call_args
+        self.assertEqual(self.svc.CUSTOMERS, args[0])
+        self.assertEqual(data, args[1])
+
+    def _load_returns(self, data):
+        self.store.load.return_value = data
+
+
+class CustomerTest(_CustomerTestCase):
+    """Customer CRUD scenarios using a per-test mock JSON store."""
+
     # --- Create Customers ---
     # Happy path: create and read back
     def test_create_customer_writes_to_storage(self):
@@ -48,6 +62,10 @@ class CustomerTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.svc.create_customer("C2", "SinMail", "no-at-domain")
 
+    def test_create_customer_email_without_local_part_raises(self):
+        with self.assertRaises(ValueError):
+            self.svc.create_customer("C2", "SinMail", "@example.com")
+
     def test_create_customer_empty_id_raises(self):
         with self.assertRaises(ValueError):
             self.svc.create_customer("", "A", "a@example.com")
@@ -66,6 +84,29 @@ class CustomerTest(unittest.TestCase):
         # Assert
         self._assert_save([])
 
+    def test_delete_customer_cold_cache_keeps_raw_rows(self):
+        data = [
+            {"id": "C1", "name": "X", "email": "x@x.com"},
+            {"id": "C2", "name": "Y", "email": "y@y.com", "vip": True},
+        ]
+        self.store.load.return_value = data
+
+        self.svc.delete_customer("C1")
+
+        self._assert_save([data[1]])
+        self.assertIs(data[1], self.store.save.call_args.args[1][0])
+
+    def test_delete_customer_warm_cache_does_not_reload(self):
+        self.store.load.return_value = [
+            {"id": "C1", "name": "X", "email": "x@x.com"}
+        ]
+        self.svc.get_customer("C1")
+
+        self.svc.delete_customer("C1")
+
+        self.store.load.assert_called_once_with(self.svc.CUSTOMERS)
+        self._assert_save([])
+
     # Negative 3: delete unknown
     def test_delete_customer_not_found_raises(self):
         with self.assertRaises(ValueError):
@@ -117,11 +158,80 @@ class CustomerTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.svc.display_customer_info("NOPE")
 
-    def _assert_save(self, data):
-        self.store.save.assert_called_once()
-        args, _ = self.store.save.call_args
-        self.assertEqual(self.svc.CUSTOMERS, args[0])
-        self.assertEqual(data, args[1])
+    def test_save_customers_writes_all_rows(self):
+        self.svc.save_customers(
+            [Customer(id="C1", name="A", email="a@example.com")]
+        )
 
-    def _load_returns(self, data):
-        self.store.load.return_value = data
+        self._assert_save(
+            [{"id": "C1", "name": "A", "email": "a@example.com"}]
+        )
+
+
+class CustomerCacheTest(_CustomerTestCase):
+    """Index caching, batching and deferred flushes."""
+
+    # --- Cache ---
+
+    def test_load_customers_is_cached_while_signature_is_unchanged(self):
+        self._load_returns([{"id": "C1", "name": "A", "email": "a@a.com"}])
+        self.store.signature.return_value = (0, 1, 10)
+
+        self.svc.get_customer("C1")
+        self.svc.get_customer("C1")
+
+        self.store.load.assert_called_once_with(self.svc.CUSTOMERS)
+
+    def test_load_customers_reloads_when_signature_changes(self):
+        self._load_returns([{"id": "C1", "name": "A", "email": "a@a.com"}])
+        self.store.signature.side_effect = [(0, 1, 10), (0, 2, 10)]
+
+        self.svc.get_customer("C1")
+        self.svc.get_customer("C1")
+
+        self.assertEqual(2, self.store.load.call_count)
+
+    def test_create_then_get_customer_does_not_reload(self):
+        self.store.load.return_value = []
+        self.svc.create_customer("C1", "Benja", "b@example.com")
+
+        customer = self.svc.get_customer("C1")
+
+        self.assertEqual("Benja", customer.name)
+        self.store.load.assert_called_once_with(self.svc.CUSTOMERS)
+
+    # --- Batch ---
+
+    def test_batch_writes_once_on_exit(self):
+        self.store.load.return_value = []
+        with self.svc.batch():
+            self.svc.create_customer("C1", "A", "a@example.com")
+            self.svc.create_customer("C2", "B", "b@example.com")
+            self.svc.update_customer("C1", name="Z")
+            self.store.save.assert_not_called()
+
+        self._assert_save([
+            {"id": "C1", "name": "Z", "email": "a@example.com"},
+            {"id": "C2", "name": "B", "email": "b@example.com"},
+        ])
+
+    def test_without_autoflush_changes_wait_for_flush(self):
+        self.store.load.return_value = []
+        svc = CustomerService(self.store, autoflush=False)
+        svc.create_customer("C1", "A", "a@example.com")
+        self.store.save.assert_not_called()
+
+        svc.flush()
+        svc.flush()
+
+        self._assert_save(
+            [{"id": "C1", "name": "A", "email": "a@example.com"}]
+        )
+
+    def test_delete_customer_warm_cache_unknown_raises(self):
+        self._load_returns([{"id": "C1", "name": "A", "email": "a@a.com"}])
+        self.svc.get_customer("C1")
+
+        with self.assertRaises(ValueError):
+            self.svc.delete_customer("NOPE")
+        self.store.save.assert_not_called()
@@ -7,21 +7,31 @@ and robustness when the underlying hotels JSON file is malformed.
 # Keep tests lightweight—method names tell the story.
 # Document at module/class level; avoid noisy method docstrings.
 # pylint: disable=missing-function-docstring
-import copy
 import unittest
 from unittest.mock import MagicMock
 
 from reservation.hotel_service import HotelService
+from reservation.models import Hotel
 
 
-class HotelTest(unittest.TestCase):
-    """Hotel scenarios using a per-test temporary JSON store."""
+class _HotelTestCase(unittest.TestCase):
+    """Shared fixture: a HotelService over a per-test mock JSON store."""
 
     def setUp(self):
         # Mocked store for every test
         self.store = MagicMock()
         self.svc = HotelService(self.store)
 
+    def _assert_save(self, data):
+        self.store.save.assert_called_once()
+        args, _ = self.store.save.call_args
+        self.assertEqual(self.svc.HOTELS, args[0])
+        self.assertEqual(data, args[1])
+
+
+class HotelTest(_HotelTestCase):
+    """Hotel CRUD scenarios using a per-test mock JSON store."""
+
     def test_create_hotel_writes_expected_row(self):
         # Arrange
         self.store.load.return_value = []  # no hotels yet
@@ -32,6 +42,16 @@ class HotelTest(unittest.TestCase):
         data = [{"id": "H1", "name": "Hotel Azul", "rooms": 3}]
         self._assert_save(data)
 
+    def test_create_hotel_returns_created_hotel(self):
+        self.store.load.return_value = []
+
+        hotel = self.svc.create_hotel("H1", "Hotel Azul", 3)
+
+        self.assertEqual(
+            {"id": "H1", "name": "Hotel Azul", "rooms": 3}, hotel.to_dict()
+        )
+        self.assertIs(hotel, self.svc.get_hotel("H1"))
+
     def test_create_hotel_with_valid_rooms(self):
         self.store.load.return_value = []
 
@@ -57,6 +77,11 @@ class HotelTest(unittest.TestCase):
         self.store.load.assert_not_called()
         self.store.save.assert_not_called()
 
+    def test_create_hotel_non_integer_rooms_raises(self):
+        with self.assertRaises(ValueError):
+            self.svc.create_hotel("HX", "X", "3")
+        self.store.save.assert_not_called()
+
     def test_create_hotel_empty_id_raises(self):
         with self.assertRaises(ValueError):
             self.svc.create_hotel("", "X", 1)
@@ -101,8 +126,9 @@ class HotelTest(unittest.TestCase):
             _ = self.svc.display_hotel_info("NOPE")
 
     def test_update_hotel_name(self):
-        initial = [{"id": "H1", "name": "Old", "rooms": 3}]
-        self.store.load.return_value = copy.deepcopy(initial)
+        self.store.load.return_value = [
+            {"id": "H1", "name": "Old", "rooms": 3}
+        ]
 
         self.svc.update_hotel("H1", name="New")
         self.store.load.assert_called_once_with(self.svc.HOTELS)
@@ -146,8 +172,70 @@ class HotelTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.svc.delete_hotel("UNKNOWN_HOTEL_ID")
 
-    def _assert_save(self, data):
-        self.store.save.assert_called_once()
-        args, _ = self.store.save.call_args
-        self.assertEqual(self.svc.HOTELS, args[0])
-        self.assertEqual(data, args[1])
+    def test_save_hotels_writes_all_rows(self):
+        self.svc.save_hotels([Hotel(id="H1", name="X", rooms=3)])
+
+        self._assert_save([{"id": "H1", "name": "X", "rooms": 3}])
+
+
+class HotelCacheTest(_HotelTestCase):
+    """Index caching, cached summaries and batching."""
+
+    # --- Cache ---
+    def test_display_hotel_info_reuses_formatted_string(self):
+        data = [{"id": "HX", "name": "Hotel X", "rooms": 10}]
+        self.store.load.return_value = data
+        first = self.svc.display_hotel_info("HX")
+        self.assertIs(first, self.svc.display_hotel_info("HX"))
+
+    def test_load_hotels_missing_file_is_not_cached(self):
+        self.store.signature.return_value = None
+        self.store.load.return_value = []
+
+        self.svc.get_hotel("H1")
+        self.svc.get_hotel("H1")
+
+        self.assertEqual(2, self.store.load.call_count)
+
+    def test_update_then_display_hotel_uses_cached_rows(self):
+        self.store.load.return_value = [{"id": "H1", "name": "X", "rooms": 3}]
+        self.svc.update_hotel("H1", name="Y")
+
+        summary = self.svc.display_hotel_info("H1")
+
+        self.assertEqual("Hotel H1: Y (rooms=3)", summary)
+        self.store.load.assert_called_once_with(self.svc.HOTELS)
+
+    def test_failed_save_does_not_leave_hotel_in_cache(self):
+        self.store.load.return_value = []
+        self.store.save.side_effect = OSError("disk full")
+        with self.assertRaises(OSError):
+            self.svc.create_hotel("H1", "Hotel Azul", 3)
+
+        self.assertIsNone(self.svc.get_hotel("H1"))
+
+    def test_batch_does_not_write_when_nothing_changed(self):
+        self.store.load.return_value = [{"id": "H1", "name": "X", "rooms": 3}]
+        with self.svc.batch():
+            self.svc.get_hotel("H1")
+        self.store.save.assert_not_called()
+
+    def test_delete_hotel_warm_cache_does_not_reload(self):
+        self.store.load.return_value = [
+            {"id": "H1", "name": "X", "rooms": 3},
+            {"id": "H2", "name": "Y", "rooms": 1},
+        ]
+        self.svc.get_hotel("H1")
+
+        self.svc.delete_hotel("H2")
+
+        self.store.load.assert_called_once_with(self.svc.HOTELS)
+        self._assert_save([{"id": "H1", "name": "X", "rooms": 3}])
+
+    def test_delete_hotel_warm_cache_unknown_raises(self):
+        self.store.load.return_value = [{"id": "H1", "name": "X", "rooms": 3}]
+        self.svc.get_hotel("H1")
+
+        with self.assertRaises(ValueError):
+            self.svc.delete_hotel("NOPE")
+        self.store.save.assert_not_called()
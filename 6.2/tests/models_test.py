@@ -0,0 +1,45 @@
+"""Model tests for copying and pickling the frozen dataclasses.
+
+The models declare `__slots__` on frozen dataclasses, which the default
+copy/pickle protocol cannot restore; these check the round trips.
+"""
+
+# Keep tests lightweight—method names tell the story.
+# pylint: disable=missing-function-docstring
+import copy
+import pickle
+import unittest
+
+from reservation.models import Customer, Hotel, Reservation
+
+MODELS = (
+    Hotel(id="H1", name="Hotel Azul", rooms=3),
+    Customer(id="C1", name="Benja", email="b@example.com"),
+    Reservation(id="R1", hotel_id="H1", customer_id="C1", room_number=1,
+                status="active", created_at="2026-02-19T10:23:09-06:00"),
+)
+
+
+class ModelsTest(unittest.TestCase):
+    """Copy and pickle round trips for Hotel, Customer and Reservation."""
+
+    def test_copy_round_trip(self):
+        for model in MODELS:
+            with self.subTest(model=type(model).__name__):
+                self.assertEqual(model, copy.copy(model))
+
+    def test_deepcopy_round_trip(self):
+        for model in MODELS:
+            with self.subTest(model=type(model).__name__):
+                self.assertEqual(model, copy.deepcopy(model))
+
+    def test_pickle_round_trip(self):
+        for model in MODELS:
+            with self.subTest(model=type(model).__name__):
+                self.assertEqual(model, pickle.loads(pickle.dumps(model)))
+
+    def test_copy_of_displayed_model_keeps_its_text(self):
+        hotel = Hotel(id="H1", name="Hotel Azul", rooms=3)
+        text = str(hotel)
+
+        self.assertEqual(text, str(copy.copy(hotel)))
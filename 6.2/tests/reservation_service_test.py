@@ -6,12 +6,19 @@ rules, and behavior when the underlying JSON file is malformed.
 
 # Keep tests lightweight—method names tell the story.
 # pylint: disable=missing-function-docstring
+import os
+import tempfile
+import time
 import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock
 
 from reservation.customer_service import CustomerService
 from reservation.hotel_service import HotelService
+from reservation.models import Reservation
 from reservation.reservation_service import ReservationService
+from reservation.storage import JsonStore
 
 NOW = "2026-02-19T10:23:09-06:00"
 
@@ -20,8 +27,8 @@ def _fixed_now() -> str:
     return NOW
 
 
-class ReservationTest(unittest.TestCase):
-    """End-to-end reservation scenarios using a temporary JSON store."""
+class _ReservationTestCase(unittest.TestCase):
+    """Shared fixture: one hotel (two rooms) and one customer, mocked."""
 
     def setUp(self):
         self.store, _ = self._store_with_maps(
@@ -33,12 +40,29 @@ class ReservationTest(unittest.TestCase):
         )
         self.svc = ReservationService(self.store, now=_fixed_now)
 
+    @staticmethod
+    def _store_with_maps(*, hotels=None, customers=None, reservations=None):
+        store = MagicMock()
+        # Respuestas por “catálogo” para load
+        load_map = {
+            HotelService.HOTELS: hotels or [],
+            CustomerService.CUSTOMERS: customers or [],
+            ReservationService.RESERVATIONS: reservations or [],
+        }
+        store.load.side_effect = lambda name: load_map.get(name, [])
+        return store, load_map
+
+
+class ReservationTest(_ReservationTestCase):
+    """End-to-end reservation scenarios using a mocked JSON store."""
+
     def test_create_reservation_ok(self):
         rid = self.svc.create_reservation("R1", "H1", "C1", room_number=1)
         self.assertEqual("R1", rid)
 
-        self.store.save.assert_called_once()
-        args, _ = self.store.save.call_args
+        self.store.save.assert_not_called()
+        self.store.append.assert_called_once()
+        args, _ = self.store.append.call_args
         self.assertEqual(ReservationService.RESERVATIONS, args[0])
         res = [
             {
@@ -50,7 +74,7 @@ class ReservationTest(unittest.TestCase):
                 "created_at": NOW
             }
         ]
-        self.assertEqual(res, args[1])
+        self.assertEqual(res, [args[1]])
 
     def test_create_reservation_with_current_date(self):
         self.store, _ = self._store_with_maps(
@@ -64,8 +88,9 @@ class ReservationTest(unittest.TestCase):
         self.svc = ReservationService(self.store, now=_fixed_now)
         self.svc.create_reservation("R1", "H1", "C1", room_number=1)
 
-        self.store.save.assert_called_once()
-        args, _ = self.store.save.call_args
+        self.store.save.assert_not_called()
+        self.store.append.assert_called_once()
+        args, _ = self.store.append.call_args
         self.assertEqual(ReservationService.RESERVATIONS, args[0])
         res = [
             {
@@ -77,7 +102,7 @@ class ReservationTest(unittest.TestCase):
                 "created_at": "2026-02-19T10:23:09-06:00"
             }
         ]
-        self.assertEqual(res, args[1])
+        self.assertEqual(res, [args[1]])
 
     def test_create_reservation_reuse_cancelled_hotel_room(self):
         self.store, _ = self._store_with_maps(
@@ -101,18 +126,11 @@ class ReservationTest(unittest.TestCase):
         rid = self.svc.create_reservation("R2", "H1", "C1", room_number=1)
         self.assertEqual("R2", rid)
 
-        self.store.save.assert_called_once()
-        args, _ = self.store.save.call_args
+        self.store.save.assert_not_called()
+        self.store.append.assert_called_once()
+        args, _ = self.store.append.call_args
         self.assertEqual(ReservationService.RESERVATIONS, args[0])
         res = [
-            {
-                "id": "R1",
-                "hotel_id": "H1",
-                "customer_id": "C1",
-                "room_number": 1,
-                "status": "cancelled",
-                "created_at": NOW
-            },
             {
                 "id": "R2",
                 "hotel_id": "H1",
@@ -122,7 +140,7 @@ class ReservationTest(unittest.TestCase):
                 "created_at": NOW
             }
         ]
-        self.assertEqual(res, args[1])
+        self.assertEqual(res, [args[1]])
 
     def test_reservation_hotel_not_found_raises(self):
         with self.assertRaises(ValueError):
@@ -201,35 +219,282 @@ class ReservationTest(unittest.TestCase):
         )
         self.svc = ReservationService(self.store)
         self.svc.cancel_reservation("R9")
-        self.store.save.assert_called_once()
-        args, _ = self.store.save.call_args
+        self.store.save.assert_not_called()
+        self.store.append.assert_called_once()
+        args, _ = self.store.append.call_args
         self.assertEqual(ReservationService.RESERVATIONS, args[0])
-        self.assertEqual(
-            [
-                {
-                    "id": "R9",
-                    "hotel_id": "H1",
-                    "customer_id": "C1",
-                    "room_number": 2,
-                    "created_at": "2010-08-09T09:23:34-09:00",
-                    "status": "cancelled"
-                }
-            ],
-            args[1]
-        )
+        self.assertEqual({"id": "R9", "status": "cancelled"}, args[1])
+
+    def test_room_taken_by_reservation_created_in_same_session(self):
+        self.svc.create_reservation("R1", "H1", "C1", room_number=1)
+        with self.assertRaises(ValueError):
+            self.svc.create_reservation("R2", "H1", "C1", room_number=1)
+
+    def test_room_is_free_again_after_cancel_in_same_session(self):
+        self.svc.create_reservation("R1", "H1", "C1", room_number=1)
+        self.svc.cancel_reservation("R1")
+
+        rid = self.svc.create_reservation("R2", "H1", "C1", room_number=1)
+
+        self.assertEqual("R2", rid)
+        self.assertEqual(3, self.store.append.call_count)
+        self.store.save.assert_not_called()
+
+    def test_cancel_reservation_does_not_mutate_loaded_rows(self):
+        row = {"id": "R1", "hotel_id": "H1", "customer_id": "C1",
+               "room_number": 1, "status": "active", "created_at": NOW}
+        self.store, _ = self._store_with_maps(reservations=[row])
+        self.svc = ReservationService(self.store)
+
+        self.svc.cancel_reservation("R1")
+
+        self.assertEqual("active", row["status"])
+        _, appended = self.store.append.call_args.args
+        self.assertEqual("cancelled", appended["status"])
+
+    def test_room_number_is_stored_as_int(self):
+        self.svc.create_reservation("R1", "H1", "C1", room_number="2")
+
+        _, row = self.store.append.call_args.args
+        self.assertEqual(2, row["room_number"])
+        with self.assertRaises(ValueError):
+            self.svc.create_reservation("R2", "H1", "C1", room_number=2)
 
     def test_cancel_unknown_reservation_raises(self):
         with self.assertRaises(ValueError):
             self.svc.cancel_reservation("RX")
 
-    @staticmethod
-    def _store_with_maps(*, hotels=None, customers=None, reservations=None):
-        store = MagicMock()
-        # Respuestas por “catálogo” para load
-        load_map = {
-            HotelService.HOTELS: hotels or [],
-            CustomerService.CUSTOMERS: customers or [],
-            ReservationService.RESERVATIONS: reservations or [],
-        }
-        store.load.side_effect = lambda name: load_map.get(name, [])
-        return store, load_map
+    def test_default_clock_stamps_local_time_with_offset(self):
+        svc = ReservationService(self.store)
+        svc.create_reservation("R1", "H1", "C1", room_number=1)
+
+        _, row = self.store.append.call_args.args
+        created = datetime.fromisoformat(row["created_at"])
+        self.assertIsNotNone(created.utcoffset())
+
+    @unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+    def test_default_clock_follows_zone_offset_changes(self):
+        svc = ReservationService(self.store)
+        offsets = []
+        saved = os.environ.get("TZ")
+        try:
+            for zone in ("UTC0", "EST+5"):
+                os.environ["TZ"] = zone
+                time.tzset()
+                offsets.append(datetime.fromisoformat(svc.now()).utcoffset())
+        finally:
+            if saved is None:
+                os.environ.pop("TZ", None)
+            else:
+                os.environ["TZ"] = saved
+            time.tzset()
+
+        self.assertEqual([timedelta(0), timedelta(hours=-5)], offsets)
+
+    def test_save_reservations_writes_all_rows(self):
+        row = {"id": "R1", "hotel_id": "H1", "customer_id": "C1",
+               "room_number": 1, "status": "active", "created_at": NOW}
+        # pylint: disable-next=protected-access
+        self.svc._save_reservations([Reservation.from_dict(row)])
+
+        self.store.save.assert_called_once_with(
+            ReservationService.RESERVATIONS, [row]
+        )
+
+
+class ReservationBulkTest(_ReservationTestCase):
+    """Batched and bulk reservation writes."""
+
+    def test_batch_of_reservations_is_saved_once(self):
+        with self.svc.batch():
+            self.svc.create_reservation("R1", "H1", "C1", room_number=1)
+            self.svc.create_reservation("R2", "H1", "C1", room_number=2)
+            self.svc.cancel_reservation("R1")
+
+        self.store.append.assert_not_called()
+        self.store.save.assert_called_once()
+        _, rows = self.store.save.call_args.args
+        self.assertEqual(["cancelled", "active"], [r["status"] for r in rows])
+
+    def test_bulk_create_writes_once(self):
+        ids = self.svc.create_reservations_bulk([
+            ("R1", "H1", "C1", 1),
+            ("R2", "H1", "C1", 2),
+        ])
+
+        self.assertEqual(["R1", "R2"], ids)
+        self.store.append.assert_not_called()
+        self.store.save.assert_called_once()
+        _, rows = self.store.save.call_args.args
+        self.assertEqual(["R1", "R2"], [r["id"] for r in rows])
+
+    def test_bulk_create_without_rows_writes_nothing(self):
+        self.assertEqual([], self.svc.create_reservations_bulk([]))
+
+        self.store.save.assert_not_called()
+        self.store.append.assert_not_called()
+
+    def test_bulk_create_rejects_whole_batch_on_invalid_row(self):
+        with self.assertRaises(ValueError):
+            self.svc.create_reservations_bulk([
+                ("R1", "H1", "C1", 1),
+                ("R2", "H1", "C1", 1),  # same room as R1
+            ])
+
+        self.store.save.assert_not_called()
+        self.assertEqual([], self.svc.load_reservations())
+        self.assertEqual(
+            "R1", self.svc.create_reservation("R1", "H1", "C1", 1)
+        )
+
+    def test_bulk_create_checks_file_signatures_once(self):
+        self.svc.create_reservations_bulk([("R1", "H1", "C1", 1)])
+        one_row = self.store.signature.call_count
+        self.store, _ = self._store_with_maps(
+            hotels=[{"id": "H1", "name": "Hotel Azul", "rooms": 3}],
+            customers=[
+                {"id": "C1", "name": "Benja", "email": "b@example.com"}
+            ],
+        )
+        self.svc = ReservationService(self.store, now=_fixed_now)
+
+        self.svc.create_reservations_bulk(
+            [("R1", "H1", "C1", 1), ("R2", "H1", "C1", 2),
+             ("R3", "H1", "C1", 3)]
+        )
+
+        self.assertEqual(one_row, self.store.signature.call_count)
+
+
+class ReservationCacheTest(_ReservationTestCase):
+    """Shared indexes, interning and the snapshot cache."""
+
+    def test_injected_services_share_their_cache(self):
+        hotels = HotelService(self.store)
+        customers = CustomerService(self.store)
+        svc = ReservationService(
+            self.store, now=_fixed_now,
+            hotel_service=hotels, customer_service=customers,
+        )
+        hotels.get_hotel("H1")
+        customers.get_customer("C1")
+        self.store.load.reset_mock()
+
+        svc.create_reservation("R1", "H1", "C1", room_number=1)
+
+        self.assertIs(hotels, svc.hotel_service)
+        self.store.load.assert_called_once_with(
+            ReservationService.RESERVATIONS
+        )
+
+    def test_loaded_reservations_share_repeated_strings(self):
+        rows = [
+            {"id": f"R{i}", "hotel_id": "".join(["H", "1"]),
+             "customer_id": "C1", "room_number": i,
+             "status": "".join(["act", "ive"]), "created_at": NOW}
+            for i in (1, 2)
+        ]
+        self.store, _ = self._store_with_maps(reservations=rows)
+        first, second = ReservationService(self.store).load_reservations()
+
+        self.assertIs(first.hotel_id, second.hotel_id)
+        self.assertIs(first.status, second.status)
+
+    def test_created_reservation_reuses_stored_ids(self):
+        hotel_id = "".join(["H", "1"])
+        self.svc.create_reservation("R1", hotel_id, "C1", room_number=1)
+
+        created = self.svc.load_reservations()[0]
+        self.assertIs(
+            self.svc.hotel_service.get_hotel("H1").id, created.hotel_id
+        )
+
+    def test_cancel_then_create_loads_reservations_once(self):
+        self.store, _ = self._store_with_maps(
+            hotels=[{"id": "H1", "name": "Hotel Azul", "rooms": 2}],
+            customers=[
+                {"id": "C1", "name": "Benja", "email": "b@example.com"}
+            ],
+            reservations=[
+                {"id": "R1", "hotel_id": "H1", "customer_id": "C1",
+                 "room_number": 1, "status": "active", "created_at": NOW}
+            ],
+        )
+        self.svc = ReservationService(self.store, now=_fixed_now)
+
+        self.svc.cancel_reservation("R1")
+        self.svc.create_reservation("R2", "H1", "C1", room_number=1)
+
+        loaded = [c.args[0] for c in self.store.load.call_args_list]
+        self.assertEqual(1, loaded.count(ReservationService.RESERVATIONS))
+
+    def test_snapshot_lists_all_collections(self):
+        snap = self.svc.snapshot()
+
+        self.assertEqual(["H1"], [h.id for h in snap["hotels"]])
+        self.assertEqual(["C1"], [c.id for c in snap["customers"]])
+        self.assertEqual([], snap["reservations"])
+
+    def test_snapshot_is_reused_while_files_are_unchanged(self):
+        first = self.svc.snapshot()
+        second = self.svc.snapshot()
+
+        self.assertIs(first, second)
+        self.assertEqual(3, self.store.load.call_count)
+
+    def test_snapshot_shows_changes_pending_in_a_batch(self):
+        self.svc.snapshot()
+        with self.svc.hotel_service.batch():
+            self.svc.hotel_service.create_hotel("H2", "Hotel Norte", 1)
+
+            hotels = self.svc.snapshot()["hotels"]
+
+        self.assertEqual(["H1", "H2"], [h.id for h in hotels])
+
+    def test_snapshot_reloads_only_the_changed_file(self):
+        versions = {}
+        self.store.signature.side_effect = lambda name: versions.get(name, 1)
+        self.svc.snapshot()
+
+        versions[ReservationService.RESERVATIONS] = 2
+        self.svc.snapshot()
+
+        self.assertEqual(4, self.store.load.call_count)
+        self.store.load.assert_called_with(ReservationService.RESERVATIONS)
+
+    def test_failed_append_drops_the_cached_index(self):
+        self.store.append.side_effect = OSError("disk full")
+        with self.assertRaises(OSError):
+            self.svc.create_reservation("R1", "H1", "C1", room_number=1)
+        self.store.append.side_effect = None
+
+        self.assertEqual([], self.svc.load_reservations())
+        loaded = [c.args[0] for c in self.store.load.call_args_list]
+        self.assertEqual(2, loaded.count(ReservationService.RESERVATIONS))
+
+
+class ReservationFileTest(unittest.TestCase):
+    """Reservation flows against a real JsonStore in an empty directory.
+
+    The mocked suites cannot see how the store combines its JSON file
+    with the append log, so these run end to end on disk.
+    """
+
+    def setUp(self):
+        # pylint: disable-next=consider-using-with
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base = Path(tmp.name)
+        store = JsonStore(self.base)
+        HotelService(store).create_hotel("H1", "Hotel Azul", 2)
+        CustomerService(store).create_customer("C1", "Benja", "b@x.com")
+        self.svc = ReservationService(store, now=_fixed_now)
+
+    def test_first_reservation_is_kept_without_a_reservations_file(self):
+        self.svc.create_reservation("R1", "H1", "C1", room_number=1)
+
+        self.assertEqual(["R1"], [r.id for r in self.svc.load_reservations()])
+        with self.assertRaises(ValueError):
+            self.svc.create_reservation("R2", "H1", "C1", room_number=1)
+        reopened = ReservationService(JsonStore(self.base))
+        self.assertEqual(["R1"], [r.id for r in reopened.load_reservations()])
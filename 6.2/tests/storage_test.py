@@ -5,36 +5,49 @@ Covers:
 - save then load round-trip
 - corrupted JSON -> logs error and returns empty list
 - save overwrites existing content
+- appended rows are folded in on load and compacted away by save
+- parsed rows are reused until the file changes on disk
 """
 
 # Keep tests lightweight—method names tell the story.
 # Document at module/class level; avoid noisy method docstrings.
 # pylint: disable=missing-function-docstring
+# Parse-count tests wrap the module's private decoder.
+# pylint: disable=protected-access
 
 from __future__ import annotations
 
-import io
+import os
 import tempfile
 import unittest
-from contextlib import ExitStack, redirect_stdout
 from pathlib import Path
+from unittest import mock
 
+from reservation import storage
 from reservation.storage import JsonStore
 
 
-class StoreTest(unittest.TestCase):
-    """Tests for the JSON-backed storage adapter (JsonStore)."""
+class _StoreTestCase(unittest.TestCase):
+    """Shared fixture: a JsonStore over a fresh directory per test."""
 
-    def setUp(self):
-        # Manage resource-allocating ops via ExitStack (satisfies pylint R1732)
-        self._stack = ExitStack()
-        self.addCleanup(self._stack.close)
+    @classmethod
+    def setUpClass(cls):
+        # One temp dir for the class, removed once when the class finishes
+        # pylint: disable-next=consider-using-with
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.tmp = tmp.name
 
-        # Per-test temp dir
-        self.tmp = self._stack.enter_context(tempfile.TemporaryDirectory())
-        self.base = Path(self.tmp)
+    def setUp(self):
+        # Per-test subdirectory: a single mkdir instead of mkdtemp + rmtree
+        self.base = Path(self.tmp) / self._testMethodName
+        self.base.mkdir()
         self.store = JsonStore(self.base)
 
+
+class StoreTest(_StoreTestCase):
+    """Tests for the JSON-backed storage adapter (JsonStore)."""
+
     def test_load_missing_file_returns_empty_list(self):
         rows = self.store.load("hotels.json")  # file does not exist
         self.assertEqual([], rows)
@@ -49,21 +62,19 @@ class StoreTest(unittest.TestCase):
     def test_load_invalid_json_logs_and_returns_empty_list(self):
         # Create an invalid JSON file
         file = "customers.json"
-        content = "{ BAD JSON ]"
-        (self.base / file).write_text(content, encoding="utf-8")
+        (self.base / file).write_bytes(b"{ BAD JSON ]")
 
-        buf = io.StringIO()
-        with redirect_stdout(buf):
+        with self.assertLogs("reservation.storage", "ERROR") as logs:
             rows = self.store.load("customers.json")
 
         self.assertEqual([], rows)
-        log = buf.getvalue()
+        log = "\n".join(logs.output)
         self.assertIn("invalid JSON", log)
-        self.assertIn("Continuing with empty list", log)
+        self.assertIn("continuing with empty list", log)
 
     def test_save_overwrites_existing_file(self):
         path = self.base / "reservations.json"
-        path.write_text('["stale"]', encoding="utf-8")
+        path.write_bytes(b'["stale"]')
 
         fresh = [
             {
@@ -77,3 +88,368 @@ class StoreTest(unittest.TestCase):
 
         reloaded = self.store.load("reservations.json")
         self.assertEqual(fresh, reloaded)
+
+    @unittest.skipIf(storage.orjson is None, "orjson not installed")
+    def test_large_file_is_loaded_through_mmap(self):
+        data = [{"id": f"H{i}", "name": "Hotel", "rooms": i}
+                for i in range(1, 50)]
+        self.store.save("hotels.json", data)
+
+        with mock.patch.object(storage, "_MMAP_MIN_SIZE", 1), \
+                mock.patch.object(storage.mmap, "mmap",
+                                  wraps=storage.mmap.mmap) as mapped:
+            out = JsonStore(self.base).load("hotels.json")
+
+        self.assertEqual(data, out)
+        mapped.assert_called_once()
+
+    def test_signature_missing_file_is_none(self):
+        self.assertIsNone(self.store.signature("hotels.json"))
+
+    def test_signature_changes_after_save(self):
+        self.store.save("hotels.json", [])
+        before = self.store.signature("hotels.json")
+
+        self.store.save("hotels.json", [])
+
+        self.assertIsNotNone(before)
+        self.assertNotEqual(before, self.store.signature("hotels.json"))
+
+    def test_failed_save_keeps_previous_file(self):
+        self.store.save("hotels.json", [{"id": "H1"}])
+
+        with mock.patch.object(storage.os, "replace", side_effect=OSError):
+            with self.assertRaises(OSError):
+                self.store.save("hotels.json", [{"id": "H2"}])
+
+        self.assertEqual(
+            [{"id": "H1"}], JsonStore(self.base).load("hotels.json")
+        )
+        self.assertEqual(["hotels.json"], sorted(
+            p.name for p in self.base.iterdir()
+        ))
+
+    def test_file_that_grew_after_stat_is_read_fully(self):
+        path = self.base / "hotels.json"
+        path.write_bytes(b'[{"id": "H1"}, {"id": "H2"}]')
+
+        data = storage._read_file(path, 4)
+
+        self.assertEqual(path.read_bytes(), data)
+
+    def test_short_read_is_continued_until_eof(self):
+        path = self.base / "hotels.json"
+        payload = b'[{"id": "H1"}, {"id": "H2"}]'
+        path.write_bytes(payload)
+        real_read = os.read
+
+        def short_first_read(fd, size):
+            short_first_read.calls += 1
+            return real_read(fd, 5 if short_first_read.calls == 1 else size)
+
+        short_first_read.calls = 0
+        with mock.patch.object(storage.os, "read", short_first_read):
+            data = storage._read_file(path, len(payload))
+
+        self.assertEqual(payload, data)
+
+    def test_save_is_compact_by_default(self):
+        self.store.save("hotels.json", [{"id": "H1", "rooms": 2}])
+
+        self.assertEqual(
+            b'[{"id":"H1","rooms":2}]',
+            (self.base / "hotels.json").read_bytes(),
+        )
+
+    def test_pretty_store_indents_saved_files(self):
+        store = JsonStore(self.base, pretty=True)
+        store.save("hotels.json", [{"id": "H1"}])
+
+        self.assertEqual(
+            '[\n  {\n    "id": "H1"\n  }\n]',
+            (self.base / "hotels.json").read_text(encoding="utf-8"),
+        )
+
+    def test_collection_paths_are_built_once(self):
+        first = self.store._paths_of("hotels.json")
+
+        self.assertIs(first, self.store._paths_of("hotels.json"))
+        self.assertEqual(
+            (self.base / "hotels.json", self.base / "hotels.log"), first
+        )
+
+    def test_stdlib_fallback_round_trip(self):
+        pretty = JsonStore(self.base, pretty=True)
+        with mock.patch.object(storage, "orjson", None):
+            self.store.save("hotels.json", [{"id": "H1"}])
+            compact = (self.base / "hotels.json").read_bytes()
+            pretty.save("customers.json", [{"id": "C1"}])
+            self.store.append("hotels.json", {"id": "H2"})
+            hotels = JsonStore(self.base).load("hotels.json")
+
+        self.assertEqual(b'[{"id":"H1"}]', compact)
+        self.assertEqual(
+            b'[\n  {\n    "id": "C1"\n  }\n]',
+            (self.base / "customers.json").read_bytes(),
+        )
+        self.assertEqual([{"id": "H1"}, {"id": "H2"}], hotels)
+
+
+class StoreAppendLogTest(_StoreTestCase):
+    """Single-row appends to the side log and their replay."""
+
+    def test_appended_rows_are_applied_on_load(self):
+        self.store.save("reservations.json", [
+            {"id": "R1", "status": "active"},
+            {"id": "R2", "status": "active"},
+        ])
+
+        self.store.append(
+            "reservations.json", {"id": "R3", "status": "active"}
+        )
+        self.store.append(
+            "reservations.json", {"id": "R1", "status": "cancelled"}
+        )
+
+        self.assertEqual(
+            [
+                {"id": "R1", "status": "cancelled"},
+                {"id": "R2", "status": "active"},
+                {"id": "R3", "status": "active"},
+            ],
+            self.store.load("reservations.json"),
+        )
+
+    def test_appended_partial_row_updates_only_its_fields(self):
+        self.store.save("reservations.json", [
+            {"id": "R1", "room_number": 2, "status": "active"},
+        ])
+
+        self.store.append(
+            "reservations.json", {"id": "R1", "status": "cancelled"}
+        )
+
+        self.assertEqual(
+            [{"id": "R1", "room_number": 2, "status": "cancelled"}],
+            self.store.load("reservations.json"),
+        )
+
+    def test_append_does_not_rewrite_the_json_file(self):
+        self.store.save("reservations.json", [{"id": "R1"}])
+        path = self.base / "reservations.json"
+        before = path.read_bytes()
+
+        self.store.append("reservations.json", {"id": "R2"})
+
+        self.assertEqual(before, path.read_bytes())
+        self.assertTrue((self.base / "reservations.log").exists())
+
+    def test_save_removes_the_append_log(self):
+        self.store.save("reservations.json", [])
+        self.store.append("reservations.json", {"id": "R1"})
+
+        self.store.save("reservations.json", [{"id": "R1"}])
+
+        self.assertFalse((self.base / "reservations.log").exists())
+        self.assertEqual([{"id": "R1"}], self.store.load("reservations.json"))
+
+    def test_signature_changes_after_append(self):
+        self.store.save("reservations.json", [])
+        before = self.store.signature("reservations.json")
+
+        self.store.append("reservations.json", {"id": "R1"})
+
+        self.assertNotEqual(before, self.store.signature("reservations.json"))
+
+    def test_rows_appended_before_first_save_are_loaded(self):
+        self.store.append("reservations.json", {"id": "R1"})
+
+        self.assertIsNotNone(self.store.signature("reservations.json"))
+        self.assertEqual(
+            [{"id": "R1"}], JsonStore(self.base).load("reservations.json")
+        )
+
+    def test_log_is_replayed_over_invalid_json(self):
+        (self.base / "reservations.json").write_bytes(b"{ BAD JSON ]")
+        self.store.append("reservations.json", {"id": "R1"})
+
+        with self.assertLogs("reservation.storage", "ERROR"):
+            rows = self.store.load("reservations.json")
+
+        self.assertEqual([{"id": "R1"}], rows)
+
+    def test_torn_log_line_is_skipped(self):
+        self.store.save("reservations.json", [{"id": "R1"}])
+        (self.base / "reservations.log").write_bytes(
+            b'{"id":"R2"}\n{"id":"R'
+        )
+
+        with self.assertLogs("reservation.storage", "WARNING") as logs:
+            rows = self.store.load("reservations.json")
+
+        self.assertEqual([{"id": "R1"}, {"id": "R2"}], rows)
+        self.assertIn("skipping unreadable log entry", logs.output[0])
+
+    def test_append_after_torn_line_is_kept(self):
+        self.store.save("reservations.json", [{"id": "R1", "status": "a"}])
+        (self.base / "reservations.log").write_bytes(b'{"id":"R')
+
+        self.store.append("reservations.json", {"id": "R1", "status": "c"})
+
+        with self.assertLogs("reservation.storage", "WARNING"):
+            rows = self.store.load("reservations.json")
+        self.assertEqual([{"id": "R1", "status": "c"}], rows)
+
+    def test_large_log_is_compacted_on_append(self):
+        self.store.save("reservations.json", [])
+        with mock.patch.object(storage, "_COMPACT_MIN_SIZE", 0):
+            self.store.append("reservations.json", {"id": "R1"})
+
+        self.assertEqual([{"id": "R1"}], self.store.load("reservations.json"))
+        self.assertFalse((self.base / "reservations.log").exists())
+        self.assertIn(b"R1", (self.base / "reservations.json").read_bytes())
+
+    def test_load_does_not_write(self):
+        self.store.save("reservations.json", [])
+        self.store.append("reservations.json", {"id": "R1"})
+        before = self.store.signature("reservations.json")
+
+        with mock.patch.object(storage, "_COMPACT_MIN_SIZE", 0):
+            self.store.load("reservations.json")
+
+        self.assertEqual(before, self.store.signature("reservations.json"))
+        self.assertTrue((self.base / "reservations.log").exists())
+
+    def test_blank_log_lines_are_ignored(self):
+        self.store.save("reservations.json", [{"id": "R1"}])
+        (self.base / "reservations.log").write_bytes(b'\n{"id":"R2"}\n\n')
+
+        self.assertEqual(
+            [{"id": "R1"}, {"id": "R2"}], self.store.load("reservations.json")
+        )
+
+    def test_invalid_utf8_is_handled_alike_by_both_decoders(self):
+        (self.base / "hotels.json").write_bytes(b'[{"id": "H\xff"}]')
+        (self.base / "hotels.log").write_bytes(b'{"id": "H\xfe"}\n')
+
+        for decoder in (storage.orjson, None):
+            with self.subTest(orjson=decoder is not None), \
+                    mock.patch.object(storage, "orjson", decoder), \
+                    self.assertLogs("reservation.storage") as logs:
+                rows = JsonStore(self.base).load("hotels.json")
+
+            self.assertEqual([], rows)
+            self.assertIn("invalid JSON", logs.output[0])
+            self.assertIn("unreadable log entry", logs.output[1])
+
+
+class StoreCacheTest(_StoreTestCase):
+    """Buffered writes and the parsed-file cache."""
+
+    def test_buffered_writes_each_file_once_on_exit(self):
+        path = self.base / "hotels.json"
+        with self.store.buffered():
+            self.store.save("hotels.json", [{"id": "H1"}])
+            self.store.save("hotels.json", [{"id": "H1"}, {"id": "H2"}])
+
+            self.assertFalse(path.exists())
+            self.assertEqual(
+                [{"id": "H1"}, {"id": "H2"}], self.store.load("hotels.json")
+            )
+
+        self.assertEqual(
+            [{"id": "H1"}, {"id": "H2"}], self.store.load("hotels.json")
+        )
+
+    def test_buffered_append_is_merged_without_a_log(self):
+        self.store.save("reservations.json", [{"id": "R1", "status": "a"}])
+
+        with self.store.buffered():
+            self.store.append("reservations.json", {"id": "R2"})
+            self.store.append(
+                "reservations.json", {"id": "R1", "status": "c"}
+            )
+
+        self.assertFalse((self.base / "reservations.log").exists())
+        self.assertEqual(
+            [{"id": "R1", "status": "c"}, {"id": "R2"}],
+            self.store.load("reservations.json"),
+        )
+
+    def test_buffered_discards_changes_when_the_block_raises(self):
+        self.store.save("hotels.json", [{"id": "H1"}])
+
+        with self.assertRaises(RuntimeError):
+            with self.store.buffered():
+                self.store.save("hotels.json", [])
+                self.store.save("customers.json", [{"id": "C1"}])
+                raise RuntimeError("boom")
+
+        self.assertEqual([{"id": "H1"}], self.store.load("hotels.json"))
+        self.assertFalse((self.base / "customers.json").exists())
+        self.assertEqual([], self.store.load("customers.json"))
+
+    def test_failed_flush_keeps_unwritten_files_buffered(self):
+        real_write = self.store._write
+
+        def fail_on_customers(name, rows):
+            if name == "customers.json":
+                raise OSError("disk full")
+            real_write(name, rows)
+
+        with mock.patch.object(self.store, "_write", fail_on_customers):
+            with self.assertRaises(OSError):
+                with self.store.buffered():
+                    self.store.save("hotels.json", [{"id": "H1"}])
+                    self.store.save("customers.json", [{"id": "C1"}])
+                    self.store.save("reservations.json", [{"id": "R1"}])
+
+        self.assertTrue((self.base / "hotels.json").exists())
+        self.assertFalse((self.base / "customers.json").exists())
+        self.assertFalse((self.base / "reservations.json").exists())
+        self.assertEqual([{"id": "C1"}], self.store.load("customers.json"))
+
+        self.store.append("customers.json", {"id": "C2"})
+        self.store.save("reservations.json", [{"id": "R2"}])
+
+        fresh = JsonStore(self.base)
+        self.assertEqual(
+            [{"id": "C1"}, {"id": "C2"}], fresh.load("customers.json")
+        )
+        self.assertEqual([{"id": "R2"}], self.store.load("reservations.json"))
+        self.assertEqual([{"id": "R2"}], fresh.load("reservations.json"))
+        self.assertFalse((self.base / "customers.log").exists())
+
+    def test_repeated_load_reuses_parsed_rows(self):
+        (self.base / "hotels.json").write_bytes(b'[{"id": "H1"}]')
+
+        with mock.patch.object(
+            storage, "_loads", wraps=storage._loads
+        ) as parse:
+            first = self.store.load("hotels.json")
+            second = self.store.load("hotels.json")
+
+        self.assertIs(first, second)
+        parse.assert_called_once()
+
+    def test_load_after_save_does_not_parse(self):
+        self.store.save("hotels.json", [{"id": "H1"}])
+
+        with mock.patch.object(
+            storage, "_loads", wraps=storage._loads
+        ) as parse:
+            rows = self.store.load("hotels.json")
+
+        self.assertEqual([{"id": "H1"}], rows)
+        parse.assert_not_called()
+
+    def test_external_change_is_picked_up(self):
+        path = self.base / "hotels.json"
+        path.write_bytes(b'[{"id": "H1"}]')
+        self.store.load("hotels.json")
+
+        path.write_bytes(b'[{"id": "H1"}, {"id": "H2"}]')
+
+        self.assertEqual(
+            [{"id": "H1"}, {"id": "H2"}], self.store.load("hotels.json")
+        )